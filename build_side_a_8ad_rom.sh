@@ -5,16 +5,15 @@ echo "=== Building Polygondwanaland Side A ROM with 8AD Audio ==="
 
 # Create GBFS for Side A (8AD format)
 echo "Creating Side A 8AD GBFS..."
-mkdir -p gbfs_content/side_a_8ad
-cp album_processed/side_a_8ad/*.ad gbfs_content/side_a_8ad/
 
-# Build GBFS filesystem  
+# Build GBFS filesystem straight from the encoded tracks (gbfs stores basenames only,
+# so there is no need to stage copies first)
 cd gbfs_content
-../tools/gbfs64/gbfs side_a_8ad.gbfs side_a_8ad/*.ad
+../tools/gbfs64/gbfs side_a_8ad.gbfs ../album_processed/side_a_8ad/*.ad
 cd ..
 
 echo "GBFS Contents:"
-ls -lh gbfs_content/side_a_8ad/
+ls -lh album_processed/side_a_8ad/
 echo "GBFS Size: $(ls -lh gbfs_content/side_a_8ad.gbfs | awk '{print $5}')"
 
 # Build the base ROM with 8AD support
@@ -7,24 +7,48 @@ echo "=== Processing Polygondwanaland Album to 8AD ==="
 mkdir -p album_processed/side_a_8ad
 mkdir -p album_processed/side_b_8ad
 
+# Build the encoder from source so the pipeline never runs a stale myima binary
+(cd tools/8ad && ./build_encoder.sh)
+
+# Scratch space: one subdirectory per track for its temp WAV and log
+WORK_DIR="$(mktemp -d)"
+trap 'rm -rf "$WORK_DIR" album_processed/side_?_8ad/*.ad.tmp' EXIT
+
 # Function to convert WAV to 8AD using Pin Eight's pipeline
 convert_to_8ad() {
     local input_file="$1"
     local output_file="$2"
     local track_name="$3"
+    local job_dir="$4"
     
     echo "Processing: $track_name"
     echo "  Input: $input_file"
     echo "  Output: $output_file"
-    
+
+    if [ ! -f "$input_file" ]; then
+        echo "  ✗ Missing source WAV"
+        return 1
+    fi
+
+    # Skip tracks already encoded from the current WAV (sox + encode is the slow part)
+    if [ "$output_file" -nt "$input_file" ]; then
+        echo "  Size: $(ls -lh "$output_file" | awk '{print $5}')"
+        echo "  ✓ Up to date, skipped"
+        echo
+        return
+    fi
+
     # Use Pin Eight's exact specifications: mono, 18157 Hz, 16-bit
-    sox "$input_file" -r 18157 -c 1 -b 16 temp_8ad.wav
+    sox "$input_file" -r 18157 -c 1 -b 16 "$job_dir/temp_8ad.wav"
     
-    # Convert to 8AD format
-    ./tools/8ad/myima temp_8ad.wav "$output_file"
+    # Convert to 8AD format; only a complete encode replaces the output, via a
+    # rename within the same directory, so an interrupted run never leaves a
+    # partial file that looks up to date
+    ./tools/8ad/myima "$job_dir/temp_8ad.wav" "$output_file.tmp"
+    mv "$output_file.tmp" "$output_file"
     
     # Clean up temp file
-    rm -f temp_8ad.wav
+    rm -f "$job_dir/temp_8ad.wav"
     
     # Show file size
     echo "  Size: $(ls -lh "$output_file" | awk '{print $5}')"
@@ -32,19 +56,49 @@ convert_to_8ad() {
     echo
 }
 
+# Tracks are independent, so each side's tracks are encoded in parallel.
+# Every job logs to its own file; logs are printed in track order afterwards.
+JOBS=()
+
+start_track() {
+    local job_dir="$WORK_DIR/$(basename "$2" .ad)"
+
+    mkdir -p "$job_dir"
+    convert_to_8ad "$1" "$2" "$3" "$job_dir" > "$job_dir/log" 2>&1 &
+    JOBS+=("$!:$job_dir")
+}
+
+wait_for_tracks() {
+    local failed=0
+    local job
+
+    for job in "${JOBS[@]}"; do
+        wait "${job%%:*}" || failed=1
+        cat "${job#*:}/log"
+    done
+    JOBS=()
+
+    if [ $failed -ne 0 ]; then
+        echo "✗ One or more tracks failed to encode"
+        return 1
+    fi
+}
+
 echo "=== Processing Side A ==="
-convert_to_8ad "album_source/side_a/1 Crumbling Castle.wav" "album_processed/side_a_8ad/01_crumbling_castle.ad" "Crumbling Castle"
-convert_to_8ad "album_source/side_a/2 Polygondwanaland.wav" "album_processed/side_a_8ad/02_polygon.ad" "Polygondwanaland"  
-convert_to_8ad "album_source/side_a/3 The Castle In The Air.wav" "album_processed/side_a_8ad/03_castle_in_air.ad" "The Castle In The Air"
-convert_to_8ad "album_source/side_a/4 Deserted Dunes Welcome Weary Feet.wav" "album_processed/side_a_8ad/04_deserted_dunes.ad" "Deserted Dunes Welcome Weary Feet"
+start_track "album_source/side_a/1 Crumbling Castle.wav" "album_processed/side_a_8ad/01_crumbling_castle.ad" "Crumbling Castle"
+start_track "album_source/side_a/2 Polygondwanaland.wav" "album_processed/side_a_8ad/02_polygon.ad" "Polygondwanaland"  
+start_track "album_source/side_a/3 The Castle In The Air.wav" "album_processed/side_a_8ad/03_castle_in_air.ad" "The Castle In The Air"
+start_track "album_source/side_a/4 Deserted Dunes Welcome Weary Feet.wav" "album_processed/side_a_8ad/04_deserted_dunes.ad" "Deserted Dunes Welcome Weary Feet"
+wait_for_tracks
 
 echo "=== Processing Side B ==="
-convert_to_8ad "album_source/side_b/5 Inner Cell.wav" "album_processed/side_b_8ad/05_inner_cell.ad" "Inner Cell"
-convert_to_8ad "album_source/side_b/6 Loyalty.wav" "album_processed/side_b_8ad/06_loyalty.ad" "Loyalty"
-convert_to_8ad "album_source/side_b/7 Horology.wav" "album_processed/side_b_8ad/07_horology.ad" "Horology"
-convert_to_8ad "album_source/side_b/8 Tetrachromacy.wav" "album_processed/side_b_8ad/08_tetrachromacy.ad" "Tetrachromacy"
-convert_to_8ad "album_source/side_b/9 Searching....wav" "album_processed/side_b_8ad/09_searching.ad" "Searching..."
-convert_to_8ad "album_source/side_b/10 The Fourth Colour.wav" "album_processed/side_b_8ad/10_fourth_colour.ad" "The Fourth Colour"
+start_track "album_source/side_b/5 Inner Cell.wav" "album_processed/side_b_8ad/05_inner_cell.ad" "Inner Cell"
+start_track "album_source/side_b/6 Loyalty.wav" "album_processed/side_b_8ad/06_loyalty.ad" "Loyalty"
+start_track "album_source/side_b/7 Horology.wav" "album_processed/side_b_8ad/07_horology.ad" "Horology"
+start_track "album_source/side_b/8 Tetrachromacy.wav" "album_processed/side_b_8ad/08_tetrachromacy.ad" "Tetrachromacy"
+start_track "album_source/side_b/9 Searching....wav" "album_processed/side_b_8ad/09_searching.ad" "Searching..."
+start_track "album_source/side_b/10 The Fourth Colour.wav" "album_processed/side_b_8ad/10_fourth_colour.ad" "The Fourth Colour"
+wait_for_tracks
 
 echo "=== Processing Complete ==="
 echo "Side A total size: $(du -sh album_processed/side_a_8ad | awk '{print $1}')"
@@ -25,7 +25,6 @@ extern const GBFS_FILE *fs;
 static int current_track = 0;
 static int playing = 0;
 static int paused = 0; // Pause state - audio loaded but not playing
-static const unsigned char *track_data_start;
 static const unsigned char *track_data_end;
 static int auto_advanced = 0; // Flag to prevent multiple auto-advances per track
 
@@ -77,7 +76,6 @@ void start_8ad_track(int track_num)
     ad.last_sample = 0;
     ad.last_index = 0;
     
-    track_data_start = track_data;
     track_data_end = track_data + track_len;
     current_track = track_num;
     playing = 1;
@@ -130,19 +128,16 @@ void mixer_8ad(void)
     // Decode exactly MIXBUF_SIZE samples from AUDIO_FRAME_BYTES bytes
     decode_ad(&ad, mixbuf[cur_mixbuf], ad.data, MIXBUF_SIZE);
     ad.data += AUDIO_FRAME_BYTES;
-    
-    // DEBUG: Track progress info for debugging auto-advance
-    u32 track_length = track_data_end - track_data_start;
-    u32 current_position = ad.data - track_data_start;
-    SPRITE_PALETTE[28] = (track_length >> 16) & 0xFFFF; // Track length high
-    SPRITE_PALETTE[29] = (current_position >> 12) & 0xFFFF; // Position (scaled down)
-    
+
     // FAST balanced frequency analysis - optimized for GBA performance
     static int low_pass = 0; // Single low-pass for bass
     static int prev_sample = 0;
-    
+    int baseline_total = 0; // Shared baseline for all 7 bands, applied once per frame
+    long band_totals[7] = {0}; // Per-frame sums kept local, flushed to the globals once below
+    const signed char *frame = mixbuf[cur_mixbuf];
+
     for (int i = 0; i < MIXBUF_SIZE; i++) {
-      int sample = mixbuf[cur_mixbuf][i];
+      int sample = frame[i];
       int abs_sample = (sample < 0) ? -sample : sample;
       
       // Simple but effective filtering
@@ -156,25 +151,27 @@ void mixer_8ad(void)
       // FAST balanced distribution - keep the energy spread but simpler
       
       // Bass bands get bass content + baseline boost
-      spectrum_accumulators_8ad[0] += bass_content + (bass_content >> 1) + (abs_sample >> 6); // Sub-bass
-      spectrum_accumulators_8ad[1] += bass_content + (abs_sample >> 5); // Bass
+      band_totals[0] += bass_content + (bass_content >> 1) + (abs_sample >> 6); // Sub-bass
+      band_totals[1] += bass_content + (abs_sample >> 5); // Bass
       
       // Bar[2]: Enhanced bass-mid for symmetrical spectrum response
-      spectrum_accumulators_8ad[2] += abs_sample + (bass_content >> 1) + (treble_content >> 2); // Full raw + bass + treble mix
+      band_totals[2] += abs_sample + (bass_content >> 1) + (treble_content >> 2); // Full raw + bass + treble mix
       
       // Bar[3] and Bar[4]: AGGRESSIVE guitar/vocal frequency targeting
-      spectrum_accumulators_8ad[3] += abs_sample + (treble_content >> 1); // Low-mid: DOUBLE treble content
-      spectrum_accumulators_8ad[4] += abs_sample + treble_content; // Mid: FULL treble content for maximum guitar response
+      band_totals[3] += abs_sample + (treble_content >> 1); // Low-mid: DOUBLE treble content
+      band_totals[4] += abs_sample + treble_content; // Mid: FULL treble content for maximum guitar response
       
       // Bar[5] and Bar[6]: MAXIMUM high-frequency sensitivity for cymbals/hi-hats  
-      spectrum_accumulators_8ad[5] += abs_sample + treble_content + (treble_content >> 1); // High-mid: raw + 150% treble
-      spectrum_accumulators_8ad[6] += abs_sample + (abs_sample >> 3); // Treble: gentle processing like Bar[0] but with actual sample data
+      band_totals[5] += abs_sample + treble_content + (treble_content >> 1); // High-mid: raw + 150% treble
+      band_totals[6] += abs_sample + (abs_sample >> 3); // Treble: gentle processing like Bar[0] but with actual sample data
       
-      // Simple baseline activity for 7 bands
-      int baseline = abs_sample >> 7;
-      for(int i = 0; i < 7; i++) {
-        spectrum_accumulators_8ad[i] += baseline;
-      }
+      // Simple baseline activity for 7 bands - summed here, added once below
+      baseline_total += abs_sample >> 7;
+    }
+
+    // Flush frame totals once per frame; every band also gets the same baseline
+    for (int band = 0; band < 7; band++) {
+      spectrum_accumulators_8ad[band] += band_totals[band] + baseline_total;
     }
     spectrum_sample_count_8ad += MIXBUF_SIZE;
   } else {
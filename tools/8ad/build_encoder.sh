@@ -8,7 +8,7 @@ gcc -o myima myima.c readwav.c -lm
 
 if [ $? -eq 0 ]; then
     echo "✓ 8AD encoder built successfully"
-    echo "Usage: ./myima input.wav output.ad"
+    echo "Usage: ./myima input.wav output.ad [decomp.wav]"
 else 
     echo "✗ Failed to build 8AD encoder"
     exit 1
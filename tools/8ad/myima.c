@@ -38,7 +38,7 @@ Visit http://www.pineight.com/ for more information.
 
 This is an ADPCM encoder and decoder.  It writes out an ADPCM
 bitstream (which, with the appropriate settings, can be IMA
-compliant) and also writes out the result of coding and decoding.
+compliant) and can also write out the result of coding and decoding.
 It allows for interchangeable quantizers and predictors; one is the
 common IMA ADPCM setup, and the other has been tweaked for better
 attack characteristics by Damian Yerrick.
@@ -399,12 +399,13 @@ int main(int argc, char **argv)
 {
   WAVE_SRC wav;
   IMA_STATE enc, dec;
-  FILE *outfp, *codefp;
+  FILE *outfp = NULL, *codefp;
 
   if(argc < 3)
   {
     fputs("wav28ad by Damian Yerrick: compresses pcm wav file to 8ad\n"
-          "usage: wav28ad song.wav song.8ad\n", stderr);
+          "usage: wav28ad song.wav song.8ad [decomp.wav]\n"
+          "  decomp.wav: optionally write the decoded result for listening\n", stderr);
     return EXIT_FAILURE;
   }
 
@@ -430,15 +431,21 @@ int main(int argc, char **argv)
     return EXIT_FAILURE;
   }
 
-  outfp = fopen("decomp.wav", "wb");
-  if(!outfp)
+  /* the decoded copy is only a listening aid, so skip it unless asked */
+  if(argc >= 4)
   {
-    fputs("couldn't write to output wave file\n", stderr);
-    close_wave_src(&wav);
-    fclose(codefp);
-    return EXIT_FAILURE;
+    outfp = fopen(argv[3], "wb");
+    if(!outfp)
+    {
+      fputs("couldn't write to output wave file\n", stderr);
+      perror(argv[3]);
+      close_wave_src(&wav);
+      fclose(codefp);
+      return EXIT_FAILURE;
+    }
   }
 
+  if(outfp)
   {
     WAVOUT_SPECS specs;
     unsigned char header[44];
@@ -462,27 +469,31 @@ int main(int argc, char **argv)
     signed short samples[64];
     unsigned char ima[32];
     signed short samples_out[64];
+    unsigned char pcm_out[128];
 
     /* read samples */
-    for(i = 0; i < 64; i++)
-      samples[i] = get_next_wav_sample(&wav);
+    get_wav_samples(&wav, samples, 64);
 
-    /* compress and decompress */
+    /* compress; decompress only when a decoded copy was requested */
     encode_ima(&enc, ima, samples, 64);
     fwrite(ima, 1, sizeof(ima), codefp);
     add_nibbles_to_bins(ima, 64);
+    if(!outfp)
+      continue;
     decode_ima(&dec, samples_out, ima, 64);
 
-    /* write samples */
+    /* write samples as one little-endian block */
     for(i = 0; i < 64; i++)
     {
       int yn = samples_out[i];
 
-      fputc(yn & 0xff, outfp);
-      fputc(yn >> 8, outfp);
+      pcm_out[2 * i] = yn & 0xff;
+      pcm_out[2 * i + 1] = yn >> 8;
     }
+    fwrite(pcm_out, 1, sizeof(pcm_out), outfp);
   }
-  fclose(outfp);
+  if(outfp)
+    fclose(outfp);
   fclose(codefp);
   close_wave_src(&wav);
 
@@ -184,4 +184,64 @@ int get_next_wav_sample(WAVE_SRC *wav)
 }
 
 
+/* get_wav_samples() *******************
+   Fills dst with the next count samples from a wav file.
+   Unlike get_next_wav_sample(), this reads the sample data with
+   one fread() per block instead of one fgetc() per byte.
+   Samples past the end of the data are 0.  If the file ends
+   before its data chunk does, the missing bytes also read as 0;
+   get_next_wav_sample() instead reads them as 0xff (EOF).
+*/
+void get_wav_samples(WAVE_SRC *wav, signed short *dst, size_t count)
+{
+  unsigned char buf[512];
+  size_t sample_bytes = (wav->fmt.bits_sample + 7) / 8;
+
+  if(sample_bytes == 0)
+    sample_bytes = 1;
+
+  while(count > 0)
+  {
+    size_t n = sizeof(buf) / sample_bytes;
+    size_t len, got, pos = 0;
+
+    if(n > count)
+      n = count;
+    len = n * sample_bytes;
+    if(len > wav->chunk_left)
+      len = wav->chunk_left;
+
+    got = fread(buf, 1, len, wav->fp);
+    memset(buf + got, 0, len - got);  /* truncated file */
+    wav->chunk_left -= len;
+
+    for(; n > 0 && pos < len; n--, count--)
+    {
+      int cur_sample = 0;
+      size_t i;
+
+      for(i = 0; i < sample_bytes && pos < len; i++)
+      {
+        cur_sample >>= 8;
+        cur_sample |= buf[pos++] << 8;
+      }
+
+      if(wav->fmt.bits_sample <= 8) /* handle unsigned samples */
+        cur_sample -= 32768;
+      *dst++ = (signed short)cur_sample; /* sign-extend */
+
+      if(++wav->cur_chn >= wav->fmt.channels)
+        wav->cur_chn = 0;
+    }
+
+    /* out of sample data: pad the rest with silence */
+    if(wav->chunk_left == 0)
+    {
+      memset(dst, 0, count * sizeof(*dst));
+      return;
+    }
+  }
+}
+
+
 
@@ -27,6 +27,7 @@ typedef struct WAVE_SRC
  
 int open_wave_src(WAVE_SRC *wav, const char *filename);
 int get_next_wav_sample(WAVE_SRC *wav);
+void get_wav_samples(WAVE_SRC *wav, signed short *dst, size_t count);
 void close_wave_src(WAVE_SRC *wav);
 
 #endif
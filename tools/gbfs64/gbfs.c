@@ -104,26 +104,26 @@ unsigned long fcopy(FILE *dst, FILE *src) {
 
 
 /*---------------------------------------------------------------------------------
-    fputi16()
-    write a 16-bit integer in intel format to a file
+    puti16()
+    store a 16-bit integer in intel format into a buffer
 ---------------------------------------------------------------------------------*/
-void fputi16(unsigned int in, FILE *f) {
+void puti16(unsigned char *dst, unsigned int in) {
     //---------------------------------------------------------------------------------
-    fputc(in, f);
-    fputc(in >> 8, f);
+    dst[0] = in;
+    dst[1] = in >> 8;
 }
 
 
 /*---------------------------------------------------------------------------------
-    fputi32()
-    write a 32-bit integer in intel format to a file
+    puti32()
+    store a 32-bit integer in intel format into a buffer
 ---------------------------------------------------------------------------------*/
-void fputi32(unsigned long in, FILE *f) {
+void puti32(unsigned char *dst, unsigned long in) {
     //---------------------------------------------------------------------------------
-    fputc(in, f);
-    fputc(in >> 8, f);
-    fputc(in >> 16, f);
-    fputc(in >> 24, f);
+    dst[0] = in;
+    dst[1] = in >> 8;
+    dst[2] = in >> 16;
+    dst[3] = in >> 24;
 }
 
 
@@ -229,24 +229,46 @@ int main(int argc, char **argv) {
     /* sort directory by name */
     qsort(entries, n_entries, sizeof(entries[0]), namecmp);
 
-    /* write header */
-    fwrite(GBFS_magic, 16, 1, outfile);
-    fputi32(header.total_len, outfile);
-    fputi16(header.dir_off, outfile);
-    fputi16(n_entries, outfile);
+    /* write header (reserved bytes stay zero) in one go */
+    {
+        unsigned char hdr[32] = {0};
+
+        memcpy(hdr, GBFS_magic, 16);
+        puti32(hdr + 16, header.total_len);
+        puti16(hdr + 20, header.dir_off);
+        puti16(hdr + 22, n_entries);
+        fwrite(hdr, sizeof(hdr), 1, outfile);
+    }
 
 
-    /* write directory */
+    /* write directory: build every entry in memory, then one fwrite */
     fseek(outfile, header.dir_off, SEEK_SET);
 
     {
+        /* on-disk entry: name, then 32-bit length and data offset */
+        const size_t name_size = sizeof(entries[0].name);
+        const size_t len_size = sizeof(entries[0].len);
+        const size_t entry_size = name_size + len_size + sizeof(entries[0].data_offset);
         unsigned int i;
+        unsigned char *dir = malloc(n_entries * entry_size + 1);
+
+        if(!dir) {
+            perror("could not allocate memory for directory");
+            fclose(outfile);
+            remove("gbfs.$$$");
+            free(entries);
+            return 1;
+        }
 
         for(i = 0; i < n_entries; i++) {
-            fwrite(entries[i].name, sizeof(entries[i].name), 1, outfile);
-            fputi32(entries[i].len, outfile);
-            fputi32(entries[i].data_offset, outfile);
+            unsigned char *ent = dir + i * entry_size;
+
+            memcpy(ent, entries[i].name, name_size);
+            puti32(ent + name_size, entries[i].len);
+            puti32(ent + name_size + len_size, entries[i].data_offset);
         }
+        fwrite(dir, entry_size, n_entries, outfile);
+        free(dir);
     }
 
     free(entries);